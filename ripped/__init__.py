@@ -1,2 +1,3 @@
 """RIPPED package init."""
 
+__version__ = "0.1.0"
@@ -1,14 +1,21 @@
 from dataclasses import dataclass
-from pathlib import Path
+from functools import lru_cache
 from typing import Optional
 
 
+USAGE = """Usage:
+  ripped <mode> <quality> <url>      mode: audio|video, quality: max|<height>
+  ripped convert <path> [--jobs N]   convert .webm/.mkv under path to .mp4
+  ripped menu                        interactive menu (also the default)"""
+
+
 @dataclass
 class ParsedArgs:
     mode: str
     quality: Optional[int]
     url: Optional[str]
     path: Optional[str]
+    jobs: Optional[int] = None
 
 
 def _validate_mode(raw_mode: str) -> str:
@@ -30,34 +37,70 @@ def _validate_quality(raw_quality: str) -> Optional[int]:
     return quality_int
 
 
+_URL_PREFIXES = ("http://", "https://")
+
+
+@lru_cache(maxsize=512)
 def _validate_url(url: str) -> str:
-    if not url.startswith("http"):
-        raise ValueError("URL must start with http or https.")
+    # Valid URLs are cached; the bulk clipboard loop re-checks the same strings often.
+    if not url.startswith(_URL_PREFIXES):
+        raise ValueError("URL must start with http:// or https://.")
     return url
 
 
+def _validate_jobs(raw_jobs: str) -> int:
+    try:
+        jobs_int = int(raw_jobs)
+    except ValueError as exc:
+        raise ValueError("Jobs must be a positive integer.") from exc
+    if jobs_int <= 0:
+        raise ValueError("Jobs must be a positive integer.")
+    return jobs_int
+
+
+def _extract_jobs(argv: list[str]) -> tuple[list[str], Optional[int]]:
+    """Pull an optional --jobs N / --jobs=N flag out of argv."""
+    remaining: list[str] = []
+    jobs: Optional[int] = None
+    idx = 0
+    while idx < len(argv):
+        arg = argv[idx]
+        if arg == "--jobs":
+            if idx + 1 >= len(argv):
+                raise ValueError("--jobs requires a value.")
+            jobs = _validate_jobs(argv[idx + 1])
+            idx += 2
+            continue
+        if arg.startswith("--jobs="):
+            jobs = _validate_jobs(arg.split("=", 1)[1])
+        else:
+            remaining.append(arg)
+        idx += 1
+    return remaining, jobs
+
+
 def parse_args(argv: list[str]) -> ParsedArgs:
     """
     Parse minimal CLI arguments.
 
     Supported layouts:
       - ripped <mode> <quality> <url>
-      - ripped convert <path>
+      - ripped convert <path> [--jobs N]
     """
+    argv, jobs = _extract_jobs(argv)
     if not argv:
-        raise ValueError("Usage: ripped <mode> <quality> <url> OR ripped convert <path>")
+        raise ValueError("Usage: ripped <mode> <quality> <url> OR ripped convert <path> [--jobs N]")
 
     mode = _validate_mode(argv[0])
 
     if mode == "convert":
         if len(argv) != 2:
-            raise ValueError("Usage: ripped convert <path>")
-        path = argv[1]
-        normalized_path = Path(path).expanduser().resolve()
-        if not normalized_path.exists():
-            raise ValueError("Provided path does not exist.")
-        return ParsedArgs(mode=mode, quality=None, url=None, path=str(normalized_path))
+            raise ValueError("Usage: ripped convert <path> [--jobs N]")
+        # Path normalization and the existence check happen in run_bulk_conversion.
+        return ParsedArgs(mode=mode, quality=None, url=None, path=argv[1], jobs=jobs)
 
+    if jobs is not None:
+        raise ValueError("--jobs is only supported for convert mode.")
     if len(argv) != 3:
         raise ValueError("Usage: ripped <mode> <quality> <url>")
 
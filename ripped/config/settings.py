@@ -4,6 +4,9 @@ from pathlib import Path
 DEFAULT_OUTPUT_DIR = Path("downloads")
 DEFAULT_AUDIO_BITRATE = "192k"
 
+# Concurrent downloads in bulk mode; override with RIPPED_BULK_CONCURRENCY.
+DEFAULT_BULK_CONCURRENCY = 5
+
 VIDEO_MAX_FORMAT = "bestvideo+bestaudio/best"
 AUDIO_DEFAULT_FORMAT = "bestaudio/best"
 
@@ -1,48 +1,83 @@
 import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple
 
 from ripped.config.settings import DEFAULT_AUDIO_BITRATE
+from ripped.core.ffmpeg_tools import FFMPEG_QUIET_ARGS, probe_audio_codec
 from ripped.utils.logger import log_error, log_info
 
 
 MEDIA_EXTENSIONS = {".webm", ".mkv"}
+_MEDIA_SUFFIXES = tuple(MEDIA_EXTENSIONS)
+# Files handed to a single ffmpeg process during bulk conversion.
+FFMPEG_BATCH_SIZE = 8
 
 
-def _require_ffmpeg() -> None:
-    if shutil.which("ffmpeg") is None:
+@lru_cache(maxsize=1)
+def _require_ffmpeg() -> str:
+    """Return the ffmpeg executable path; a successful probe is cached."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
         raise FileNotFoundError("ffmpeg not found. Please install ffmpeg and ensure it is in your PATH.")
+    return ffmpeg
 
 
-def _normalize_path(target: Path | str) -> Path:
+# Documents paths that are already absolute and resolved; resolve once at the API boundary.
+ResolvedPath = Path
+
+
+def _normalize_path(target: Path | str) -> ResolvedPath:
     return Path(target).expanduser().resolve()
 
 
+def _is_media_name(name: str) -> bool:
+    # A bare ".webm" is a dotfile with no suffix, matching Path.suffix semantics.
+    lowered = name.lower()
+    return lowered.endswith(_MEDIA_SUFFIXES) and lowered not in MEDIA_EXTENSIONS
+
+
+def _iter_media_files(directory: str) -> Iterator[Path]:
+    try:
+        with os.scandir(directory) as entries:
+            subdirs: List[str] = []
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    if _is_media_name(entry.name):
+                        yield Path(entry.path)
+                elif entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+    except OSError:
+        # Match os.walk: unreadable directories are skipped silently.
+        return
+    for subdir in subdirs:
+        yield from _iter_media_files(subdir)
+
+
 def find_media_files(target_path: Path | str) -> List[Path]:
     """Return a list of .webm/.mkv files under the given path (recursive)."""
-    root = _normalize_path(target_path)
+    return _find_media_files(_normalize_path(target_path))
+
 
+def _find_media_files(root: ResolvedPath) -> List[ResolvedPath]:
+    assert root.is_absolute(), root
     if root.is_file():
         return [root] if root.suffix.lower() in MEDIA_EXTENSIONS else []
 
     if not root.is_dir():
         return []
 
-    matches: List[Path] = []
-    for dirpath, _, filenames in os.walk(root):
-        for filename in filenames:
-            candidate = Path(dirpath) / filename
-            if candidate.suffix.lower() in MEDIA_EXTENSIONS:
-                matches.append(candidate.resolve())
-    return matches
+    # root is already resolved, so entries built from it are absolute.
+    return list(_iter_media_files(os.fspath(root)))
 
 
-def _dedupe_output_path(base_output: Path) -> Path:
+def _dedupe_output_path(base_output: Path, exists: Callable[[Path], bool] = Path.exists) -> Path:
     output_path = base_output
     counter = 1
-    while output_path.exists():
+    while exists(output_path):
         output_path = output_path.with_name(f"{base_output.stem}_converted{'' if counter == 1 else f'_{counter-1}'}{base_output.suffix}")
         counter += 1
     return output_path
@@ -50,18 +85,59 @@ def _dedupe_output_path(base_output: Path) -> Path:
 
 def _run_ffmpeg(cmd: Iterable[str]) -> subprocess.CompletedProcess[bytes]:
     try:
-        return subprocess.run(cmd, check=False, capture_output=True)
+        return subprocess.run(cmd, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
     except FileNotFoundError as exc:
         raise FileNotFoundError("ffmpeg not found. Please install ffmpeg and ensure it is in your PATH.") from exc
 
 
+@lru_cache(maxsize=2)
+def _mp4_codec_args(copy_audio: bool) -> Tuple[str, ...]:
+    if copy_audio:
+        return ("-c:v", "copy", "-c:a", "copy")
+    return ("-c:v", "copy", "-c:a", "aac", "-b:a", DEFAULT_AUDIO_BITRATE)
+
+
+def _mp4_map_args(input_index: int) -> Tuple[str, ...]:
+    # Batches need explicit maps, so single-file runs use the same ones to produce identical output.
+    return ("-map", f"{input_index}:v:0?", "-map", f"{input_index}:a:0?")
+
+
+def _mp4_output_args(source: Path, output_path: Path) -> Tuple[str, ...]:
+    # AAC audio is already what we want in the mp4, so the file is just remuxed.
+    # WebM only carries Opus/Vorbis, so only mkv is worth an ffprobe spawn.
+    copy_audio = source.suffix.lower() == ".mkv" and probe_audio_codec(source) == "aac"
+    return (*_mp4_codec_args(copy_audio), os.fspath(output_path))
+
+
+def _discard_output(output_path: Path) -> None:
+    if output_path.exists():
+        output_path.unlink(missing_ok=True)
+
+
+def _finish_conversion(source: Path, output_path: Path) -> Path | None:
+    """Verify the ffmpeg output and delete the original on success."""
+    if not output_path.exists() or output_path.stat().st_size == 0:
+        log_error(f"Conversion failed for {source}: output not created")
+        _discard_output(output_path)
+        return None
+
+    try:
+        source.unlink()
+    except OSError as exc:
+        log_error(f"Converted to {output_path} but could not delete original: {exc}")
+        return output_path
+
+    log_info(f"Successfully converted to {output_path}, deleting original")
+    return output_path
+
+
 def convert_to_mp4_in_place(input_path: Path | str) -> Path | None:
     """
     Convert a single media file to mp4 (AAC audio) in-place.
 
     Returns the output path on success, or None on failure.
     """
-    _require_ffmpeg()
+    ffmpeg = _require_ffmpeg()
 
     source = _normalize_path(input_path)
     suffix = source.suffix.lower()
@@ -79,78 +155,176 @@ def convert_to_mp4_in_place(input_path: Path | str) -> Path | None:
 
     desired_output = source.with_suffix(".mp4")
     output_path = _dedupe_output_path(desired_output) if desired_output.exists() else desired_output
+    return _convert_to_mp4(source, output_path, ffmpeg)
+
 
-    cmd = [
-        "ffmpeg",
+def _convert_to_mp4(source: Path, output_path: Path, ffmpeg: str) -> Path | None:
+    """Run one ffmpeg per file; safe to call from pool workers."""
+    cmd = (
+        ffmpeg,
+        *FFMPEG_QUIET_ARGS,
         "-y",
         "-i",
-        str(source),
-        "-c:v",
-        "copy",
-        "-c:a",
-        "aac",
-        "-b:a",
-        DEFAULT_AUDIO_BITRATE,
-        str(output_path),
-    ]
+        os.fspath(source),
+        *_mp4_map_args(0),
+        *_mp4_output_args(source, output_path),
+    )
 
     log_info(f"Converting {source} to MP4")
     result = _run_ffmpeg(cmd)
 
     if result.returncode != 0:
         log_error(f"Conversion failed for {source}: {result.stderr.decode(errors='ignore') if result.stderr else 'unknown error'}")
-        if output_path.exists():
-            output_path.unlink(missing_ok=True)
+        _discard_output(output_path)
         return None
 
-    if not output_path.exists() or output_path.stat().st_size == 0:
-        log_error(f"Conversion failed for {source}: output not created")
-        if output_path.exists():
-            output_path.unlink(missing_ok=True)
-        return None
+    return _finish_conversion(source, output_path)
+
+
+def _convert_batch_to_mp4(jobs: List[Tuple[Path, Path]], ffmpeg: str) -> List[Path | None]:
+    """
+    Convert several files with a single ffmpeg process.
+
+    Each input is mapped to its own output, so the process spawn and codec
+    setup are paid once per batch instead of once per file. If the batch
+    fails, every file is retried on its own so one bad input does not sink
+    the rest.
+    """
+    if len(jobs) == 1:
+        return [_convert_to_mp4(*jobs[0], ffmpeg)]
+
+    cmd = [ffmpeg, *FFMPEG_QUIET_ARGS, "-y"]
+    for source, _ in jobs:
+        cmd += ["-i", os.fspath(source)]
+    for index, (source, output_path) in enumerate(jobs):
+        cmd += [*_mp4_map_args(index), *_mp4_output_args(source, output_path)]
+
+    for source, _ in jobs:
+        log_info(f"Converting {source} to MP4")
+    result = _run_ffmpeg(cmd)
 
+    if result.returncode != 0:
+        for _, output_path in jobs:
+            _discard_output(output_path)
+        log_info(f"Batch of {len(jobs)} files failed; retrying one at a time")
+        return [_convert_to_mp4(source, output_path, ffmpeg) for source, output_path in jobs]
+
+    return [_finish_conversion(source, output_path) for source, output_path in jobs]
+
+
+def _list_names(directory: Path) -> Set[str]:
     try:
-        source.unlink()
-    except OSError as exc:
-        log_error(f"Converted to {output_path} but could not delete original: {exc}")
-        return output_path
+        with os.scandir(directory) as entries:
+            return {entry.name.lower() for entry in entries}
+    except OSError:
+        return set()
 
-    log_info(f"Successfully converted to {output_path}, deleting original")
-    return output_path
+
+def _plan_outputs(files: List[Path]) -> List[Tuple[Path, Path]]:
+    """
+    Pick every output path up front so concurrent workers never collide.
+
+    Each directory is listed once and dedupe probes hit that in-memory set
+    instead of stat-ing candidates. Names compare case-insensitively, which
+    errs toward a _converted suffix on case-sensitive filesystems.
+    """
+    listings: Dict[Path, Set[str]] = {}
+
+    def taken(path: Path) -> bool:
+        names = listings.get(path.parent)
+        if names is None:
+            names = listings[path.parent] = _list_names(path.parent)
+        return path.name.lower() in names
+
+    jobs: List[Tuple[Path, Path]] = []
+    for source in files:
+        output_path = _dedupe_output_path(source.with_suffix(".mp4"), taken)
+        listings[output_path.parent].add(output_path.name.lower())
+        jobs.append((source, output_path))
+    return jobs
 
 
-def run_bulk_conversion(target_path: Path | str) -> int:
+def _resolve_jobs(jobs: int | None, file_count: int) -> int:
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, file_count))
+
+
+def _batched(items: List[Tuple[Path, Path]], workers: int) -> List[List[Tuple[Path, Path]]]:
+    size = max(1, min(FFMPEG_BATCH_SIZE, -(-len(items) // workers)))
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def run_bulk_conversion(target_path: Path | str, jobs: int | None = None) -> int:
     """
     Convert all .webm/.mkv under the target path to .mp4.
 
-    Returns exit code: 0 if at least one success, 2 otherwise.
+    Files are grouped into batches of up to FFMPEG_BATCH_SIZE per ffmpeg
+    process, and batches run concurrently using up to ``jobs`` worker
+    threads (defaults to the CPU count). ffmpeg does the work in its own
+    process, so threads keep every core busy while log lines still reach
+    the active log sink.
+
+    Returns exit code: 0 if at least one success, 1 if the path does not
+    exist, 2 otherwise.
     """
     root = _normalize_path(target_path)
-    files = find_media_files(root)
+    if not root.exists():
+        log_error("Provided path does not exist.")
+        return 1
+
+    files = _find_media_files(root)
 
     if not files:
         log_info("No webm/mkv files found in path")
         return 2
 
     try:
-        _require_ffmpeg()
+        ffmpeg = _require_ffmpeg()
     except FileNotFoundError as exc:
         log_error(str(exc))
         return 2
 
     success_count = 0
     failure_count = 0
-
-    try:
-        for media_file in files:
-            log_info(f"Converting: {media_file}")
-            result = convert_to_mp4_in_place(media_file)
-            if result:
-                success_count += 1
-            else:
-                failure_count += 1
-    except KeyboardInterrupt:
-        log_info("Conversion interrupted by user; leaving existing files untouched.")
+    workers = _resolve_jobs(jobs, len(files))
+    batches = _batched(_plan_outputs(files), workers)
+
+    if workers == 1:
+        try:
+            for batch in batches:
+                for source, _ in batch:
+                    log_info(f"Converting: {source}")
+                for result in _convert_batch_to_mp4(batch, ffmpeg):
+                    if result:
+                        success_count += 1
+                    else:
+                        failure_count += 1
+        except KeyboardInterrupt:
+            log_info("Conversion interrupted by user; leaving existing files untouched.")
+    else:
+        log_info(f"Converting {len(files)} files with {workers} workers")
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = {executor.submit(_convert_batch_to_mp4, batch, ffmpeg): batch for batch in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    results = future.result()
+                except Exception as exc:
+                    log_error(f"Conversion failed for batch starting at {batch[0][0]}: {exc}")
+                    results = [None] * len(batch)
+                for (source, _), result in zip(batch, results):
+                    if result:
+                        success_count += 1
+                    else:
+                        failure_count += 1
+                    log_info(f"[{success_count + failure_count}/{len(files)}] {'ok' if result else 'failed'}: {source}")
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            log_info("Conversion interrupted by user; leaving existing files untouched.")
+        else:
+            executor.shutdown()
 
     processed = success_count + failure_count
     log_info(f"Processed {processed} files: {success_count} converted, {failure_count} failed")
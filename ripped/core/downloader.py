@@ -1,5 +1,7 @@
+import atexit
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional, Tuple
 
 try:
     import yt_dlp
@@ -12,6 +14,36 @@ def _require_yt_dlp() -> None:
         raise RuntimeError("yt-dlp is not installed. Please install it to enable downloads.")
 
 
+# Open YoutubeDL instances keyed by (thread, options); see download_with_ytdlp.
+# YoutubeDL is not thread-safe, so concurrent bulk downloads each get their own.
+_downloaders: Dict[Tuple[int, FrozenSet[Tuple[str, Any]]], Any] = {}
+_downloaders_lock = threading.Lock()
+
+
+def _get_downloader(ydl_opts: Dict[str, Any]) -> Any:
+    """Return the calling thread's YoutubeDL instance for these options."""
+    key = (threading.get_ident(), frozenset(ydl_opts.items()))
+    ydl = _downloaders.get(key)
+    if ydl is None:
+        _require_yt_dlp()
+        ydl = yt_dlp.YoutubeDL(ydl_opts)  # type: ignore[attr-defined]
+        with _downloaders_lock:
+            _downloaders[key] = ydl
+    return ydl
+
+
+def close_downloaders() -> None:
+    """Close cached YoutubeDL instances (saves cookies, releases connections)."""
+    with _downloaders_lock:
+        instances = list(_downloaders.values())
+        _downloaders.clear()
+    for ydl in instances:
+        ydl.close()
+
+
+atexit.register(close_downloaders)
+
+
 def get_video_info(url: str) -> Dict[str, Any]:
     """Extract metadata for a video without downloading it."""
     _require_yt_dlp()
@@ -44,17 +76,17 @@ def build_format_string(mode: str, quality: Optional[int]) -> str:
 
 def download_with_ytdlp(url: str, format_str: str, output_template: str = "%(title)s.%(ext)s") -> Dict[str, Any]:
     """Download content using yt-dlp with the provided format string."""
-    _require_yt_dlp()
     ydl_opts = {
         "format": format_str,
         "outtmpl": output_template,
         "quiet": True,
         "no_warnings": True,
     }
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:  # type: ignore[attr-defined]
-        result = ydl.extract_info(url, download=True)
-        return {
-            "filepath": Path(ydl.prepare_filename(result)),  # type: ignore[name-defined]
-            "title": result.get("title"),
-            "requested_format": format_str,
-        }
+    # Reuse one YoutubeDL per option set so bulk runs skip re-initializing extractors.
+    ydl = _get_downloader(ydl_opts)
+    result = ydl.extract_info(url, download=True)
+    return {
+        "filepath": Path(ydl.prepare_filename(result)),
+        "title": result.get("title"),
+        "requested_format": format_str,
+    }
@@ -1,48 +1,101 @@
+import os
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
+# Only errors reach stderr, so the captured output stays small.
+FFMPEG_QUIET_ARGS = ("-hide_banner", "-nostats", "-loglevel", "error")
 
-def _require_ffmpeg() -> None:
-    if shutil.which("ffmpeg") is None:
+
+@lru_cache(maxsize=1)
+def _require_ffmpeg() -> str:
+    """Return the ffmpeg executable path; a successful probe is cached."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
         raise FileNotFoundError("ffmpeg not found in PATH. Please install ffmpeg to proceed.")
+    return ffmpeg
+
+
+@lru_cache(maxsize=1)
+def _find_ffprobe() -> Optional[str]:
+    return shutil.which("ffprobe")
+
+
+@lru_cache(maxsize=1024)
+def _probe_audio_codec_cached(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    # mtime/size are part of the cache key so a rewritten file is probed again.
+    ffprobe = _find_ffprobe()
+    if ffprobe is None:
+        return None
+    cmd = [
+        ffprobe,
+        "-v",
+        "error",
+        "-select_streams",
+        "a:0",
+        "-show_entries",
+        "stream=codec_name",
+        "-of",
+        "csv=p=0",
+        path,
+    ]
+    try:
+        result = subprocess.run(cmd, check=False, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    codec = result.stdout.decode(errors="ignore").strip().lower()
+    return codec or None
+
+
+def probe_audio_codec(input_path: Path) -> Optional[str]:
+    """Return the codec name of the first audio stream, or None if unknown."""
+    try:
+        stat = input_path.stat()
+    except OSError:
+        return None
+    return _probe_audio_codec_cached(os.fspath(input_path), stat.st_mtime_ns, stat.st_size)
 
 
 def convert_to_mp3(input_path: Path, output_path: Path, bitrate: str = "192k") -> Path:
     """Convert an audio file to mp3 using ffmpeg."""
-    _require_ffmpeg()
-    cmd = [
-        "ffmpeg",
+    ffmpeg = _require_ffmpeg()
+    cmd = (
+        ffmpeg,
+        *FFMPEG_QUIET_ARGS,
         "-y",
         "-i",
-        str(input_path),
+        os.fspath(input_path),
         "-vn",
         "-codec:a",
         "libmp3lame",
         "-b:a",
         bitrate,
-        str(output_path),
-    ]
-    subprocess.run(cmd, check=True, capture_output=True)
+        os.fspath(output_path),
+    )
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
     return output_path
 
 
 def merge_audio_video(video_path: Path, audio_path: Path, output_path: Path) -> Path:
     """Mux separate audio and video files into a single mp4."""
-    _require_ffmpeg()
-    cmd = [
-        "ffmpeg",
+    ffmpeg = _require_ffmpeg()
+    cmd = (
+        ffmpeg,
+        *FFMPEG_QUIET_ARGS,
         "-y",
         "-i",
-        str(video_path),
+        os.fspath(video_path),
         "-i",
-        str(audio_path),
+        os.fspath(audio_path),
         "-c:v",
         "copy",
         "-c:a",
         "aac",
-        str(output_path),
-    ]
-    subprocess.run(cmd, check=True, capture_output=True)
+        os.fspath(output_path),
+    )
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
     return output_path
-
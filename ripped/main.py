@@ -1,22 +1,36 @@
+import asyncio
+import http.client
 import os
+import queue
+import selectors
 import sys
+import threading
 import time
+import urllib.error
+import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from subprocess import CalledProcessError
+from typing import Callable
 
-from ripped.cli.parser import ParsedArgs, parse_args
+from ripped import __version__
+from ripped.cli.parser import USAGE, ParsedArgs, parse_args
 from ripped.cli.parser import _validate_mode as validate_mode
 from ripped.cli.parser import _validate_quality as validate_quality
-from ripped.cli.parser import _validate_url as validate_url
+from ripped.cli.parser import _URL_PREFIXES, _validate_url as validate_url
 from ripped.config.settings import (
     DEFAULT_AUDIO_BITRATE,
+    DEFAULT_BULK_CONCURRENCY,
     DEFAULT_OUTPUT_DIR,
     DEFAULT_OUTPUT_TEMPLATE,
 )
 from ripped.core.converter import convert_to_mp4_in_place, run_bulk_conversion
-from ripped.core.downloader import build_format_string, download_with_ytdlp
+from ripped.core.downloader import build_format_string, close_downloaders, download_with_ytdlp
 from ripped.core.ffmpeg_tools import convert_to_mp3
-from ripped.utils.logger import clear_log_sink, log_error, log_info, set_log_sink
+from ripped.utils.logger import clear_log_sink, log_error, log_info, log_info_lines, set_log_sink
 
 
 EXIT_OK = 0
@@ -24,6 +38,21 @@ EXIT_USER_ERROR = 1
 EXIT_DOWNLOAD_ERROR = 2
 EXIT_FFMPEG_ERROR = 3
 QUALITY_CHOICES = [None, 360, 480, 720, 1080, 1440, 2160]  # None -> max
+_STDOUT_FD = 1
+POSIX_CLIPBOARD_POLL_INTERVAL = 0.5  # seconds between clipboard checks while stdin is idle
+# Bulk-mode poll interval (seconds): fast right after activity, backing off while idle.
+CLIPBOARD_POLL_MIN_INTERVAL = 0.02
+CLIPBOARD_POLL_MAX_INTERVAL = 0.5
+PRECHECK_CONCURRENCY = 10
+PRECHECK_TIMEOUT = 5  # seconds per HEAD request
+# Only statuses that mean the page is gone; 403/405/429 are common for live pages that dislike HEAD.
+_DEAD_STATUSES = frozenset({404, 410})
+
+# Menu lookup tables, built once instead of per prompt/redraw.
+_QUALITY_LABELS = tuple("max" if q is None else str(q) for q in QUALITY_CHOICES)
+_QUALITY_LABEL_BY_VALUE = dict(zip(QUALITY_CHOICES, _QUALITY_LABELS))
+_QUALITY_BY_CHOICE = {str(idx): q for idx, q in enumerate(QUALITY_CHOICES, start=1)}
+_MODE_MAP = {"1": "audio", "2": "video"}
 
 try:
     import pyperclip
@@ -33,13 +62,20 @@ try:
     import msvcrt  # Windows-only
 except ImportError:
     msvcrt = None  # type: ignore
+try:
+    from ripped.utils import _clipboard_win  # Windows-only
+except (ImportError, OSError, AttributeError):
+    _clipboard_win = None  # type: ignore
 
 
 def format_quality_label(quality: int | None) -> str:
-    return "max" if quality is None else str(quality)
+    label = _QUALITY_LABEL_BY_VALUE.get(quality)
+    return label if label is not None else str(quality)
 
 
 _warned_clipboard = False
+# Output directories already created this session; skips a mkdir per bulk download.
+_ensured_dirs: set[str] = set()
 
 def _load_logo() -> str:
     logo_path = Path(__file__).resolve().parent / "logo.txt"
@@ -49,23 +85,97 @@ def _load_logo() -> str:
         return "RIPPED"
 
 
-MENU_ART = _load_logo()
-MENU_WIDTH = max(60, max((len(line) for line in MENU_ART.splitlines()), default=0))
 FRAME_EDGE = "▒"
 FRAME_FILL = "░"
 FRAME_PAD = 4
-FRAME_WIDTH = max(MENU_WIDTH + FRAME_PAD, 70)
+
+
+@dataclass
+class _MenuTheme:
+    """
+    Logo and frame geometry for the interactive menu.
+
+    Everything is computed on first access, so CLI runs that never open the
+    menu skip reading logo.txt. The frame pieces are fixed for the session
+    and built once instead of per repaint.
+    """
+
+    edge: str = FRAME_EDGE
+    fill: str = FRAME_FILL
+    pad: int = FRAME_PAD
+
+    @cached_property
+    def art(self) -> str:
+        return _load_logo()
+
+    @cached_property
+    def width(self) -> int:
+        art_width = max(60, max((len(line) for line in self.art.splitlines()), default=0))
+        return max(art_width + self.pad, 70)
+
+    @cached_property
+    def _row_format(self) -> str:
+        inner = self.width - 4
+        return f"{self.edge} {{:<{inner}.{inner}}} {self.edge}"
+
+    def row(self, text: str) -> str:
+        return self._row_format.format(text)
+
+    def row_center(self, text: str) -> str:
+        # str.center, not "{:^}": they split odd padding differently and the header layout relies on center().
+        inner = self.width - 4
+        return f"{self.edge} {text[:inner].center(inner)} {self.edge}"
+
+    @cached_property
+    def border(self) -> str:
+        return self.edge + (self.fill * (self.width - 2)) + self.edge
+
+    @cached_property
+    def title_row(self) -> str:
+        return self.row_center("RIPPED CONTROL DECK")
+
+    @cached_property
+    def main_menu_block(self) -> str:
+        return "\n".join(
+            [
+                self.row_center("MAIN MENU"),
+                self.row("1) Download single URL"),
+                self.row("2) Bulk download (enter URLs, 'q' to finish)"),
+                self.row("3) Convert existing videos to MP4"),
+                self.row("4) Change mode"),
+                self.row("5) Change quality"),
+                self.row("6) Exit"),
+                self.border,
+                self.row_center("LAST ACTION"),
+            ]
+        )
+
+    @cached_property
+    def session_log_header(self) -> str:
+        return self.row_center("SESSION LOG")
+
+    @cached_property
+    def empty_log_row(self) -> str:
+        return self.row("No log messages yet.")
+
+    @cached_property
+    def select_option_block(self) -> str:
+        return "\n".join([self.border, self.row_center("SELECT OPTION"), self.border])
 
 
 def read_clipboard() -> str | None:
     global _warned_clipboard
-    if pyperclip is None:
+    if _clipboard_win is not None:
+        paste = _clipboard_win.paste
+    elif pyperclip is not None:
+        paste = pyperclip.paste
+    else:
         if not _warned_clipboard:
             print("Clipboard unavailable: install pyperclip for auto-capture.")
             _warned_clipboard = True
         return None
     try:
-        text = pyperclip.paste()
+        text = paste()
         return text.strip() if text else None
     except Exception as exc:
         if not _warned_clipboard:
@@ -76,32 +186,50 @@ def read_clipboard() -> str | None:
 
 def perform_download(mode: str, quality: int | None, url: str) -> int:
     """Execute a single download based on mode/quality/url."""
+    exit_code, downloaded_path = _download_stage(mode, quality, url)
+    if downloaded_path is None:
+        return exit_code
+    return _convert_stage(mode, downloaded_path)
+
+
+def _download_stage(mode: str, quality: int | None, url: str) -> tuple[int, Path | None]:
+    """Download one URL; returns the exit code and the downloaded file on success."""
     try:
         format_str = build_format_string(mode, quality)
     except ValueError as exc:
         log_error(str(exc))
-        return EXIT_USER_ERROR
+        return EXIT_USER_ERROR, None
 
-    log_info(f"Mode: {mode}")
-    log_info(f"Quality: {format_quality_label(quality)}")
-    log_info(f"URL: {url}")
-    log_info(f"Format string: {format_str}")
+    log_info_lines(
+        (
+            f"Mode: {mode}",
+            f"Quality: {format_quality_label(quality)}",
+            f"URL: {url}",
+            f"Format string: {format_str}",
+        )
+    )
 
     output_dir = Path(DEFAULT_OUTPUT_DIR)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    key = str(output_dir)
+    if key not in _ensured_dirs:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(key)
     output_template = str(output_dir / DEFAULT_OUTPUT_TEMPLATE)
 
     try:
         download_result = download_with_ytdlp(url, format_str, output_template)
     except RuntimeError as exc:
         log_error(str(exc))
-        return EXIT_DOWNLOAD_ERROR
+        return EXIT_DOWNLOAD_ERROR, None
     except Exception as exc:
-        log_error(f"Download failed: {exc}")
-        return EXIT_DOWNLOAD_ERROR
+        log_error("Download failed: %s", exc)
+        return EXIT_DOWNLOAD_ERROR, None
+
+    return EXIT_OK, download_result["filepath"]
 
-    downloaded_path: Path = download_result["filepath"]
 
+def _convert_stage(mode: str, downloaded_path: Path) -> int:
+    """Post-process a finished download (mp3 for audio, mp4 for video)."""
     if mode == "audio":
         mp3_path = downloaded_path.with_suffix(".mp3")
         try:
@@ -112,7 +240,7 @@ def perform_download(mode: str, quality: int | None, url: str) -> int:
         except CalledProcessError as exc:
             log_error(f"ffmpeg error: {exc.stderr.decode(errors='ignore') if exc.stderr else exc}")
             return EXIT_FFMPEG_ERROR
-        log_info(f"Saved audio to: {mp3_path}")
+        log_info("Saved audio to: %s", mp3_path)
     else:
         final_video_path = downloaded_path
         try:
@@ -122,21 +250,178 @@ def perform_download(mode: str, quality: int | None, url: str) -> int:
             return EXIT_FFMPEG_ERROR
         if converted_path:
             final_video_path = converted_path
-            log_info(f"Downloaded and converted to: {final_video_path}")
+            log_info("Downloaded and converted to: %s", final_video_path)
         else:
             log_error("Conversion to mp4 failed; keeping original file (may be Resolve-incompatible).")
-            log_info(f"Saved video to: {final_video_path}")
+            log_info("Saved video to: %s", final_video_path)
 
     return EXIT_OK
 
 
+def _bulk_concurrency() -> int:
+    raw = os.environ.get("RIPPED_BULK_CONCURRENCY", "")
+    try:
+        return max(1, int(raw)) if raw else DEFAULT_BULK_CONCURRENCY
+    except ValueError:
+        return DEFAULT_BULK_CONCURRENCY
+
+
+async def _download_all(
+    mode: str,
+    quality: int | None,
+    urls: list[str],
+    executor: ThreadPoolExecutor,
+    cancelled: threading.Event,
+    on_done: Callable[[int, int, Path | None], None],
+) -> None:
+    # The executor's worker count bounds how many downloads run at once.
+    loop = asyncio.get_running_loop()
+
+    async def download_one(idx: int, url: str) -> None:
+        if cancelled.is_set():
+            return
+        try:
+            exit_code, downloaded_path = await loop.run_in_executor(executor, _download_stage, mode, quality, url)
+        except asyncio.CancelledError:
+            # Only raised when a cancelled bulk run drops the queued download.
+            return
+        except Exception as exc:
+            if cancelled.is_set():
+                return
+            log_error("Download failed for %s: %s", url, exc)
+            exit_code, downloaded_path = EXIT_DOWNLOAD_ERROR, None
+        on_done(idx, exit_code, downloaded_path)
+
+    await asyncio.gather(*(download_one(idx, url) for idx, url in enumerate(urls)))
+
+
+def _head_status(url: str) -> int | None:
+    request = urllib.request.Request(url, method="HEAD")
+    try:
+        with urllib.request.urlopen(request, timeout=PRECHECK_TIMEOUT) as response:
+            return response.status
+    except urllib.error.HTTPError as exc:
+        return exc.code
+    except (OSError, ValueError, http.client.HTTPException):
+        # Malformed URLs and network or server trouble are not proof the URL is dead; let yt-dlp decide.
+        return None
+
+
+async def _precheck(urls: list[str], executor: ThreadPoolExecutor) -> list[int | None]:
+    # The executor's worker count bounds how many HEAD requests run at once.
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*(loop.run_in_executor(executor, _head_status, url) for url in urls))
+
+
+def precheck_urls(urls: list[str]) -> list[str]:
+    """
+    HEAD every URL concurrently and drop the ones that are gone (404/410).
+
+    A dead link otherwise costs a full yt-dlp extraction attempt before it
+    fails. Anything inconclusive (errors, timeouts, other statuses) is kept.
+    """
+    print(f"Checking {len(urls)} URLs...")
+    executor = ThreadPoolExecutor(max_workers=PRECHECK_CONCURRENCY, thread_name_prefix="ripped-precheck")
+    try:
+        statuses = asyncio.run(_precheck(urls, executor))
+    finally:
+        # On Ctrl+C queued checks are dropped; running ones end within PRECHECK_TIMEOUT.
+        executor.shutdown(wait=False, cancel_futures=True)
+    live: list[str] = []
+    for url, status in zip(urls, statuses):
+        if status in _DEAD_STATUSES:
+            print(f"  -> Skipping {url} (HTTP {status})")
+        else:
+            live.append(url)
+    return live
+
+
+def run_bulk_downloads(mode: str, quality: int | None, urls: list[str]) -> list[int]:
+    """
+    Download and convert several URLs as a two-stage pipeline.
+
+    Downloads run concurrently (RIPPED_BULK_CONCURRENCY at a time, default
+    DEFAULT_BULK_CONCURRENCY) on an asyncio loop in a background thread. Each
+    finished file is handed through a queue to a pool that runs the ffmpeg
+    conversions, so network and CPU work overlap. Returns one exit code per
+    URL, in input order. Ctrl+C cancels every download and conversion that
+    has not started yet.
+    """
+    total = len(urls)
+    results = [EXIT_OK] * total
+    downloaded: "queue.Queue[tuple[int, Path] | None]" = queue.Queue()
+    finished = 0
+
+    def on_done(idx: int, exit_code: int, downloaded_path: Path | None) -> None:
+        nonlocal finished
+        finished += 1
+        print(f"[{finished}/{total}] {urls[idx]}")
+        if downloaded_path is None:
+            results[idx] = exit_code
+        else:
+            downloaded.put((idx, downloaded_path))
+
+    def produce() -> None:
+        try:
+            asyncio.run(_download_all(mode, quality, urls, download_pool, cancelled, on_done))
+        finally:
+            # Wait out in-flight downloads before closing the YoutubeDL instances they use.
+            download_pool.shutdown()
+            close_downloaders()
+            downloaded.put(None)
+
+    cancelled = threading.Event()
+    download_pool = ThreadPoolExecutor(max_workers=_bulk_concurrency(), thread_name_prefix="ripped-download")
+    producer = threading.Thread(target=produce, name="ripped-download", daemon=True)
+    producer.start()
+
+    # ffmpeg does the heavy lifting in its own process, so threads are enough to keep cores busy.
+    convert_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    try:
+        futures = {}
+        while (item := downloaded.get()) is not None:
+            idx, downloaded_path = item
+            futures[convert_pool.submit(_convert_stage, mode, downloaded_path)] = idx
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                results[idx] = future.result()
+            except Exception as exc:
+                log_error("Conversion failed for %s: %s", urls[idx], exc)
+                results[idx] = EXIT_FFMPEG_ERROR
+    except KeyboardInterrupt:
+        # Start nothing new; yt-dlp calls already running cannot be interrupted from here.
+        cancelled.set()
+        download_pool.shutdown(wait=False, cancel_futures=True)
+        convert_pool.shutdown(wait=False, cancel_futures=True)
+        print("\nCancelling bulk run; waiting for downloads in progress to finish...")
+        producer.join()
+        raise
+    finally:
+        convert_pool.shutdown()
+
+    producer.join()
+    return results
+
+
 def main(argv: list[str] | None = None) -> int:
     """Entry point for the ripped CLI."""
     args = argv if argv is not None else sys.argv[1:]
 
     # No args or explicit "menu" enters interactive mode.
-    if len(args) == 0 or (len(args) == 1 and args[0].lower() == "menu"):
+    if len(args) == 0:
+        return run_menu()
+
+    # Fast exits are routed before parse_args so they skip argument validation.
+    command = args[0].lower()
+    if len(args) == 1 and command == "menu":
         return run_menu()
+    if command in ("-h", "--help"):
+        print(USAGE)
+        return EXIT_OK
+    if command == "--version":
+        print(f"ripped {__version__}")
+        return EXIT_OK
 
     try:
         parsed: ParsedArgs = parse_args(args)
@@ -148,7 +433,7 @@ def main(argv: list[str] | None = None) -> int:
         if parsed.path is None:
             log_error("A target path is required for convert mode.")
             return EXIT_USER_ERROR
-        return run_bulk_conversion(parsed.path)
+        return run_bulk_conversion(parsed.path, jobs=parsed.jobs)
 
     if parsed.url is None:
         log_error("A URL is required for download modes.")
@@ -165,74 +450,54 @@ def run_menu() -> int:
     status_message = "Ready"
     status_progress: float | None = None
     last_feedback = "Awaiting command."
-    log_lines: list[str] = []
+    log_lines: deque[str] = deque(maxlen=8)
+    theme = _MenuTheme()
 
     def push_log(level: str, message: str | object) -> None:
-        entry = f"[{level}] {message}"
-        log_lines.append(entry)
-        if len(log_lines) > 8:
-            log_lines.pop(0)
+        log_lines.append(f"[{level}] {message}")
 
     set_log_sink(push_log)
 
     def clear_screen() -> None:
         os.system("cls" if os.name == "nt" else "clear")
 
-    def _border() -> str:
-        return FRAME_EDGE + (FRAME_FILL * (FRAME_WIDTH - 2)) + FRAME_EDGE
-
-    def _row(text: str) -> str:
-        inner = text[: FRAME_WIDTH - 4]
-        return f"{FRAME_EDGE} {inner.ljust(FRAME_WIDTH - 4)} {FRAME_EDGE}"
-
-    def _row_center(text: str) -> str:
-        inner = text[: FRAME_WIDTH - 4]
-        return f"{FRAME_EDGE} {inner.center(FRAME_WIDTH - 4)} {FRAME_EDGE}"
-
     def _progress(label: str, ratio: float = 0.0) -> str:
         ratio = max(0.0, min(1.0, ratio))
-        bar_width = max(FRAME_WIDTH - len(label) - 12, 10)
+        bar_width = max(theme.width - len(label) - 12, 10)
         filled = int(bar_width * ratio)
         empty = max(bar_width - filled, 0)
-        bar = (FRAME_EDGE * filled) + (FRAME_FILL * empty)
+        bar = (theme.edge * filled) + (theme.fill * empty)
         text = f"{label}: [{bar}] {int(ratio*100):3d}%"
-        return _row(text)
-
-    def banner() -> None:
-        clear_screen()
-        print(MENU_ART)
-        print(_border())
-        print(_row_center("RIPPED CONTROL DECK"))
-        print(_row(f"Mode: {mode:<8} | Quality: {format_quality_label(quality)}"))
-        print(_row(f"Status: {status_message}"))
+        return theme.row(text)
+
+    def render_frame() -> str:
+        frame = [
+            theme.art,
+            theme.border,
+            theme.title_row,
+            theme.row(f"Mode: {mode:<8} | Quality: {format_quality_label(quality)}"),
+            theme.row(f"Status: {status_message}"),
+        ]
         if status_progress is not None:
-            print(_progress("Activity", status_progress))
-        print(_border())
+            frame.append(_progress("Activity", status_progress))
+        frame.append(theme.border)
+        frame.append(theme.main_menu_block)
+        frame.extend(theme.row(line) for line in last_feedback.splitlines() or [""])
+        frame.append(theme.border)
+        frame.append(theme.session_log_header)
+        if log_lines:
+            frame.extend(theme.row(line) for line in log_lines)
+        else:
+            frame.append(theme.empty_log_row)
+        frame.append(theme.select_option_block)
+        return "\n".join(frame) + "\n"
 
     try:
         while True:
-            banner()
-            print(_row_center("MAIN MENU"))
-            print(_row("1) Download single URL"))
-            print(_row("2) Bulk download (enter URLs, 'q' to finish)"))
-            print(_row("3) Convert existing videos to MP4"))
-            print(_row("4) Change mode"))
-            print(_row("5) Change quality"))
-            print(_row("6) Exit"))
-            print(_border())
-            print(_row_center("LAST ACTION"))
-            for line in last_feedback.splitlines() or [""]:
-                print(_row(line))
-            print(_border())
-            print(_row_center("SESSION LOG"))
-            if log_lines:
-                for line in log_lines:
-                    print(_row(line))
-            else:
-                print(_row("No log messages yet."))
-            print(_border())
-            print(_row_center("SELECT OPTION"))
-            print(_border())
+            clear_screen()
+            # One write per repaint instead of one per row.
+            sys.stdout.write(render_frame())
+            sys.stdout.flush()
 
             choice = input("> ").strip()
 
@@ -256,14 +521,14 @@ def run_menu() -> int:
                 if not urls:
                     print("No URLs provided.")
                     continue
+                urls = precheck_urls(urls)
+                if not urls:
+                    print("No reachable URLs.")
+                    continue
                 print(f"\nQueued {len(urls)} URLs. Starting downloads...")
-                for idx, url in enumerate(urls, start=1):
-                    print(f"[{idx}/{len(urls)}] {url}")
-                    status_message = f"Downloading {idx}/{len(urls)}..."
-                    status_progress = idx / len(urls)
-                    exit_code = perform_download(mode, quality, url)
+                for url, exit_code in zip(urls, run_bulk_downloads(mode, quality, urls)):
                     if exit_code != EXIT_OK:
-                        print(f"  -> Failed with exit code {exit_code}")
+                        print(f"  -> {url} failed with exit code {exit_code}")
                 print("Bulk download complete.")
                 last_feedback = f"Bulk download complete ({len(urls)} items)."
                 status_message = "Ready"
@@ -273,9 +538,6 @@ def run_menu() -> int:
                 if not target:
                     print("No path provided.")
                     continue
-                if not Path(target).expanduser().resolve().exists():
-                    print("Path does not exist.")
-                    continue
                 status_message = "Converting..."
                 status_progress = 0.0
                 exit_code = run_bulk_conversion(target)
@@ -303,6 +565,7 @@ def run_menu() -> int:
                 print("Invalid choice. Please select 1-6.")
                 last_feedback = "Invalid choice."
     finally:
+        close_downloaders()
         clear_log_sink()
 
 
@@ -325,13 +588,18 @@ def prompt_for_url() -> str | None:
 def prompt_bulk_urls() -> list[str]:
     # Windows: offer clipboard auto-capture without pressing Enter.
     if os.name == "nt" and msvcrt:
-        if pyperclip is None:
+        if pyperclip is None and _clipboard_win is None:
             print("pyperclip is required for clipboard capture. Falling back to manual entry.")
             return _prompt_bulk_urls_fallback()
         # Capture baseline clipboard so we only react to new copies.
         baseline = read_clipboard()
         return _prompt_bulk_urls_windows(baseline_clip=baseline)
 
+    # POSIX terminals: watch typed input and the clipboard at the same time.
+    if os.name != "nt" and pyperclip is not None and sys.stdin.isatty():
+        baseline = read_clipboard()
+        return _prompt_bulk_urls_posix(baseline_clip=baseline, fd=sys.stdin.fileno())
+
     return _prompt_bulk_urls_fallback()
 
 
@@ -343,50 +611,178 @@ def _prompt_bulk_urls_windows(baseline_clip: str | None) -> list[str]:
     urls: list[str] = []
     # Ignore whatever was on the clipboard when we entered bulk mode; react only to changes.
     last_clip: str | None = baseline_clip
+    last_seq: int | None = None
     buffer: str = ""
+    listener = _start_clipboard_listener()
+    # With a listener and a real console, sleep in the kernel until a key or a copy arrives.
+    console = _clipboard_win.console_input_handle() if listener is not None and _clipboard_win else None
+    idle_start = time.monotonic()
+    interval = CLIPBOARD_POLL_MIN_INTERVAL
+    # Keystroke echo bypasses sys.stdout, so push out anything still buffered there first.
+    sys.stdout.flush()
 
-    while True:
-        # Clipboard capture
-        clip = read_clipboard()
-        if clip and clip != last_clip:
-            try:
-                validated = validate_url(clip)
-                urls.append(validated)
-                print(f"\n[+] Added from clipboard: {validated} (total {len(urls)})")
-            except ValueError:
-                # Ignore non-URL clipboard content
-                pass
-            last_clip = clip
-
-        # Keyboard non-blocking read
-        if msvcrt.kbhit():
-            ch = msvcrt.getwch()
-            if ch.lower() == "q":
-                print("\nStarting downloads...")
+    try:
+        while True:
+            active = False
+            woke = None
+            # Clipboard capture: block briefly on change notifications, or poll as a fallback.
+            if console is not None:
+                wait_start = time.monotonic()
+                woke = _clipboard_win.wait_for_handles(
+                    (console, listener.event_handle), CLIPBOARD_POLL_MAX_INTERVAL
+                )
+                if woke is None and time.monotonic() - wait_start < CLIPBOARD_POLL_MAX_INTERVAL:
+                    # The wait failed instead of timing out; sleep so a broken handle cannot spin the CPU.
+                    time.sleep(interval)
+                clips = listener.drain()
+            elif listener is not None:
+                try:
+                    clips = [listener.changes.get(timeout=interval)]
+                except queue.Empty:
+                    clips = []
+                # Handle every copy made since the last pass, not just the first.
+                clips.extend(listener.drain())
+            elif _clipboard_win is not None:
+                # Only open the clipboard when the OS sequence number says it changed.
+                seq = _clipboard_win.clipboard_sequence_number()
+                clips = [read_clipboard()] if seq != last_seq else []
+                last_seq = seq
+            else:
+                clips = [read_clipboard()]
+            for clip in clips:
+                if clip and clip != last_clip:
+                    active = True
+                    last_clip = clip
+                    _add_clipboard_url(urls, clip, lead="\n")
+
+            # Keyboard non-blocking read; consume everything typed since the last pass.
+            finished = False
+            typed = False
+            while not finished and msvcrt.kbhit():
+                active = typed = True
+                ch = msvcrt.getwch()
+                if ch.lower() == "q":
+                    print("\nStarting downloads...")
+                    finished = True
+                elif ch in ("\r", "\n"):
+                    entry = buffer.strip()
+                    buffer = ""
+                    if not entry:
+                        continue
+                    try:
+                        validated = validate_url(entry)
+                        urls.append(validated)
+                        print(f"\n[+] Added: {validated} (total {len(urls)})")
+                    except ValueError as exc:
+                        print(f"\n{exc}")
+                elif ch == "\x08":  # backspace
+                    if buffer:
+                        buffer = buffer[:-1]
+                        _echo("\b \b")
+                else:
+                    buffer += ch
+                    _echo(ch)
+            if finished:
                 break
-            if ch in ("\r", "\n"):
-                entry = buffer.strip()
-                buffer = ""
+            if woke == 0 and not typed:
+                # Mouse, focus and key-up events signal the console too; drop them so the next wait blocks.
+                _clipboard_win.discard_non_key_input(console)
+
+            if active:
+                idle_start = time.monotonic()
+                interval = CLIPBOARD_POLL_MIN_INTERVAL
+            else:
+                interval = _poll_interval(time.monotonic() - idle_start)
+            if listener is None:
+                time.sleep(interval)
+    finally:
+        if listener is not None:
+            listener.stop()
+
+    return urls
+
+
+def _add_clipboard_url(urls: list[str], clip: str, lead: str = "") -> None:
+    """Queue copied text if it is a URL; other clipboard content is ignored."""
+    # Most clipboard churn is plain text; the prefix test skips it without raising from validate_url.
+    if clip.startswith(_URL_PREFIXES):
+        urls.append(validate_url(clip))
+        print(f"{lead}[+] Added from clipboard: {urls[-1]} (total {len(urls)})")
+
+
+def _echo(text: str) -> None:
+    """Echo a keystroke straight to the stdout fd, skipping the TextIOWrapper."""
+    if text.isascii():
+        # ASCII encodes the same in every console code page.
+        os.write(_STDOUT_FD, text.encode("ascii"))
+    else:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
+def _poll_interval(idle_seconds: float) -> float:
+    """Double the poll interval for every idle second, capped at the max."""
+    steps = min(int(idle_seconds), 8)
+    return min(CLIPBOARD_POLL_MAX_INTERVAL, CLIPBOARD_POLL_MIN_INTERVAL * 2**steps)
+
+
+def _start_clipboard_listener() -> "_clipboard_win.ClipboardListener | None":
+    """Start a WM_CLIPBOARDUPDATE listener, or return None to fall back to polling."""
+    if _clipboard_win is None:
+        return None
+    try:
+        listener = _clipboard_win.ClipboardListener(read_clipboard)
+        return listener if listener.start() else None
+    except OSError:
+        return None
+
+
+def _prompt_bulk_urls_posix(baseline_clip: str | None, fd: int) -> list[str]:
+    """
+    POSIX loop that reads typed lines and auto-adds copied URLs.
+
+    A selector waits on stdin with a timeout: typed lines are handled as soon
+    as they arrive, and each timeout checks the clipboard for a new copy.
+    """
+    print("Enter URLs one per line, or copy them to queue automatically. Type 'q' alone to start downloads.")
+    print("Press Enter on an empty line to use the current clipboard.")
+    urls: list[str] = []
+    # Ignore whatever was on the clipboard when we entered bulk mode; react only to changes.
+    last_clip: str | None = baseline_clip
+    pending = ""
+    finished = False
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while not finished:
+            if not selector.select(timeout=POSIX_CLIPBOARD_POLL_INTERVAL):
+                clip = read_clipboard()
+                if clip and clip != last_clip:
+                    last_clip = clip
+                    _add_clipboard_url(urls, clip)
+                continue
+
+            # The selector said stdin is readable, so this read does not block.
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk.decode(errors="ignore")).split("\n")
+            for line in lines:
+                entry = line.strip()
+                if entry.lower() == "q":
+                    finished = True
+                    break
+                if not entry and last_clip and last_clip not in urls:
+                    entry = last_clip
                 if not entry:
+                    print("No URL entered.")
                     continue
                 try:
                     validated = validate_url(entry)
                     urls.append(validated)
-                    print(f"\n[+] Added: {validated} (total {len(urls)})")
+                    print(f"[+] Added: {validated} (total {len(urls)})")
                 except ValueError as exc:
-                    print(f"\n{exc}")
-            elif ch == "\x08":  # backspace
-                if buffer:
-                    buffer = buffer[:-1]
-                    sys.stdout.write("\b \b")
-                    sys.stdout.flush()
-            else:
-                buffer += ch
-                sys.stdout.write(ch)
-                sys.stdout.flush()
-
-        time.sleep(0.05)
-
+                    print(exc)
     return urls
 
 
@@ -420,28 +816,21 @@ def prompt_mode() -> str | None:
     print(" 1) audio")
     print(" 2) video")
     choice = input("Choice: ").strip()
-    mapping = {"1": "audio", "2": "video"}
-    if choice not in mapping:
+    if choice not in _MODE_MAP:
         print("Invalid choice.")
         return None
-    return mapping[choice]
+    return _MODE_MAP[choice]
 
 
 def prompt_quality(invalid_sentinel: object) -> int | None | object:
     print("\nSelect quality:")
-    for idx, q in enumerate(QUALITY_CHOICES, start=1):
-        label = "max" if q is None else str(q)
+    for idx, label in enumerate(_QUALITY_LABELS, start=1):
         print(f" {idx}) {label}")
     choice = input("Choice: ").strip()
-    try:
-        choice_int = int(choice)
-    except ValueError:
-        print("Invalid choice.")
-        return invalid_sentinel
-    if not (1 <= choice_int <= len(QUALITY_CHOICES)):
+    if choice not in _QUALITY_BY_CHOICE:
         print("Invalid choice.")
         return invalid_sentinel
-    return QUALITY_CHOICES[choice_int - 1]
+    return _QUALITY_BY_CHOICE[choice]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,326 @@
+"""Windows clipboard helpers built directly on user32 via ctypes."""
+
+import ctypes
+import os
+import queue
+import threading
+import time
+from ctypes import wintypes
+from typing import Callable, List, Optional, Sequence
+
+if os.name != "nt":
+    raise ImportError("ripped.utils._clipboard_win is only available on Windows.")
+
+WM_DESTROY = 0x0002
+WM_CLOSE = 0x0010
+WM_CLIPBOARDUPDATE = 0x031D
+CF_UNICODETEXT = 13
+OPEN_CLIPBOARD_RETRIES = 5
+STD_INPUT_HANDLE = -10
+WAIT_OBJECT_0 = 0x000
+KEY_EVENT = 0x0001
+HWND_MESSAGE = wintypes.HWND(-3)
+
+LRESULT = ctypes.c_ssize_t
+WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+
+
+class WNDCLASSW(ctypes.Structure):
+    _fields_ = [
+        ("style", wintypes.UINT),
+        ("lpfnWndProc", WNDPROC),
+        ("cbClsExtra", ctypes.c_int),
+        ("cbWndExtra", ctypes.c_int),
+        ("hInstance", wintypes.HINSTANCE),
+        ("hIcon", wintypes.HICON),
+        ("hCursor", wintypes.HANDLE),
+        ("hbrBackground", wintypes.HBRUSH),
+        ("lpszMenuName", wintypes.LPCWSTR),
+        ("lpszClassName", wintypes.LPCWSTR),
+    ]
+
+
+class KEY_EVENT_RECORD(ctypes.Structure):
+    _fields_ = [
+        ("bKeyDown", wintypes.BOOL),
+        ("wRepeatCount", wintypes.WORD),
+        ("wVirtualKeyCode", wintypes.WORD),
+        ("wVirtualScanCode", wintypes.WORD),
+        ("UnicodeChar", wintypes.WCHAR),
+        ("dwControlKeyState", wintypes.DWORD),
+    ]
+
+
+class _INPUT_EVENT(ctypes.Union):
+    # Only key events are inspected; the other record types are at most this size.
+    _fields_ = [("KeyEvent", KEY_EVENT_RECORD)]
+
+
+class INPUT_RECORD(ctypes.Structure):
+    _fields_ = [("EventType", wintypes.WORD), ("Event", _INPUT_EVENT)]
+
+
+user32 = ctypes.WinDLL("user32", use_last_error=True)
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+user32.DefWindowProcW.restype = LRESULT
+user32.RegisterClassW.argtypes = [ctypes.POINTER(WNDCLASSW)]
+user32.RegisterClassW.restype = wintypes.ATOM
+user32.CreateWindowExW.argtypes = [
+    wintypes.DWORD,
+    wintypes.LPCWSTR,
+    wintypes.LPCWSTR,
+    wintypes.DWORD,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    wintypes.HWND,
+    wintypes.HMENU,
+    wintypes.HINSTANCE,
+    wintypes.LPVOID,
+]
+user32.CreateWindowExW.restype = wintypes.HWND
+user32.AddClipboardFormatListener.argtypes = [wintypes.HWND]
+user32.AddClipboardFormatListener.restype = wintypes.BOOL
+user32.RemoveClipboardFormatListener.argtypes = [wintypes.HWND]
+user32.RemoveClipboardFormatListener.restype = wintypes.BOOL
+user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+user32.GetMessageW.restype = wintypes.BOOL
+user32.PostMessageW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+user32.PostMessageW.restype = wintypes.BOOL
+user32.DestroyWindow.argtypes = [wintypes.HWND]
+user32.DestroyWindow.restype = wintypes.BOOL
+user32.GetClipboardSequenceNumber.argtypes = []
+user32.GetClipboardSequenceNumber.restype = wintypes.DWORD
+user32.OpenClipboard.argtypes = [wintypes.HWND]
+user32.OpenClipboard.restype = wintypes.BOOL
+user32.CloseClipboard.argtypes = []
+user32.CloseClipboard.restype = wintypes.BOOL
+user32.GetClipboardData.argtypes = [wintypes.UINT]
+user32.GetClipboardData.restype = wintypes.HANDLE
+kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+kernel32.GlobalLock.restype = wintypes.LPVOID
+kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+kernel32.GlobalUnlock.restype = wintypes.BOOL
+kernel32.GlobalSize.argtypes = [wintypes.HGLOBAL]
+kernel32.GlobalSize.restype = ctypes.c_size_t
+kernel32.GetModuleHandleW.argtypes = [wintypes.LPCWSTR]
+kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+kernel32.CreateEventW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+kernel32.CreateEventW.restype = wintypes.HANDLE
+kernel32.SetEvent.argtypes = [wintypes.HANDLE]
+kernel32.SetEvent.restype = wintypes.BOOL
+kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+kernel32.CloseHandle.restype = wintypes.BOOL
+kernel32.GetStdHandle.argtypes = [wintypes.DWORD]
+kernel32.GetStdHandle.restype = wintypes.HANDLE
+kernel32.GetConsoleMode.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
+kernel32.GetConsoleMode.restype = wintypes.BOOL
+kernel32.PeekConsoleInputW.argtypes = [wintypes.HANDLE, ctypes.POINTER(INPUT_RECORD), wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)]
+kernel32.PeekConsoleInputW.restype = wintypes.BOOL
+kernel32.ReadConsoleInputW.argtypes = [wintypes.HANDLE, ctypes.POINTER(INPUT_RECORD), wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)]
+kernel32.ReadConsoleInputW.restype = wintypes.BOOL
+kernel32.WaitForMultipleObjects.argtypes = [wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE), wintypes.BOOL, wintypes.DWORD]
+kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+
+_CLASS_NAME = "RippedClipboardListener"
+_class_lock = threading.Lock()
+_class_registered = False
+_listeners: dict = {}
+
+
+def _dispatch_message(hwnd: int, msg: int, wparam: int, lparam: int) -> int:
+    listener = _listeners.get(hwnd)
+    if listener is None:
+        return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+    return listener._handle_message(hwnd, msg, wparam, lparam)
+
+
+# The class window procedure must outlive every window created from it.
+_class_wndproc = WNDPROC(_dispatch_message)
+
+
+def _ensure_window_class(hinstance: int) -> bool:
+    global _class_registered
+    with _class_lock:
+        if not _class_registered:
+            wndclass = WNDCLASSW()
+            wndclass.lpfnWndProc = _class_wndproc
+            wndclass.hInstance = hinstance
+            wndclass.lpszClassName = _CLASS_NAME
+            if not user32.RegisterClassW(ctypes.byref(wndclass)):
+                return False
+            _class_registered = True
+    return True
+
+
+def _open_clipboard() -> bool:
+    # Other processes (often explorer.exe) hold the clipboard briefly after a copy; back off and retry.
+    delay = 0.001
+    for attempt in range(OPEN_CLIPBOARD_RETRIES):
+        if user32.OpenClipboard(None):
+            return True
+        if attempt < OPEN_CLIPBOARD_RETRIES - 1:
+            time.sleep(delay)
+            delay *= 2
+    return False
+
+
+def paste() -> Optional[str]:
+    """Return the clipboard's Unicode text, or None if it is empty, non-text, or busy."""
+    if not _open_clipboard():
+        return None
+    try:
+        handle = user32.GetClipboardData(CF_UNICODETEXT)
+        if not handle:
+            return None
+        pointer = kernel32.GlobalLock(handle)
+        if not pointer:
+            return None
+        try:
+            # GlobalSize bounds the read; the text ends at the first NUL within it.
+            size_chars = kernel32.GlobalSize(handle) // ctypes.sizeof(ctypes.c_wchar)
+            return ctypes.wstring_at(pointer, size_chars).split("\0", 1)[0]
+        finally:
+            kernel32.GlobalUnlock(handle)
+    finally:
+        user32.CloseClipboard()
+
+
+def clipboard_sequence_number() -> int:
+    """Return the system clipboard sequence number; it changes on every clipboard write."""
+    return user32.GetClipboardSequenceNumber()
+
+
+def console_input_handle() -> Optional[int]:
+    """Return the console input handle, or None when stdin is not an interactive console."""
+    handle = kernel32.GetStdHandle(STD_INPUT_HANDLE)
+    mode = wintypes.DWORD()
+    if not handle or not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        return None
+    return handle
+
+
+def _is_keystroke(record: INPUT_RECORD) -> bool:
+    # Key-down records that carry a character; msvcrt.getwch returns these.
+    key = record.Event.KeyEvent
+    return record.EventType == KEY_EVENT and bool(key.bKeyDown) and key.UnicodeChar != "\0"
+
+
+def discard_non_key_input(handle: int) -> None:
+    """
+    Drop leading console records that msvcrt never reads (mouse, focus,
+    key-up, bare modifier presses), stopping at the first keystroke so
+    typed input that arrives meanwhile is never lost.
+    """
+    record = INPUT_RECORD()
+    count = wintypes.DWORD()
+    while kernel32.PeekConsoleInputW(handle, ctypes.byref(record), 1, ctypes.byref(count)) and count.value:
+        if _is_keystroke(record):
+            return
+        kernel32.ReadConsoleInputW(handle, ctypes.byref(record), 1, ctypes.byref(count))
+
+
+def wait_for_handles(handles: Sequence[int], timeout: float) -> Optional[int]:
+    """Block until any handle is signalled; return its index, or None on timeout or failure."""
+    array = (wintypes.HANDLE * len(handles))(*handles)
+    result = kernel32.WaitForMultipleObjects(len(handles), array, False, int(timeout * 1000))
+    if WAIT_OBJECT_0 <= result < WAIT_OBJECT_0 + len(handles):
+        return result - WAIT_OBJECT_0
+    return None
+
+
+class ClipboardListener:
+    """
+    Push clipboard text onto a queue whenever Windows reports a change.
+
+    A hidden message-only window registered with AddClipboardFormatListener
+    runs on a daemon thread; the thread sleeps in GetMessageW until the OS
+    delivers WM_CLIPBOARDUPDATE, so there is no polling while idle. Every
+    change is queued, so rapid successive copies are not coalesced, and
+    ``event_handle`` (an auto-reset Win32 event) is signalled so callers can
+    wait on it alongside other kernel handles.
+    """
+
+    def __init__(self, reader: Callable[[], Optional[str]]) -> None:
+        self.changes: "queue.Queue[Optional[str]]" = queue.Queue()
+        self.event_handle = kernel32.CreateEventW(None, False, False, None)
+        if not self.event_handle:
+            raise ctypes.WinError(ctypes.get_last_error())
+        self._reader = reader
+        self._last_seq = clipboard_sequence_number()
+        self._hwnd: Optional[int] = None
+        self._ready = threading.Event()
+        self._started = False
+        self._thread = threading.Thread(target=self._run, name="ripped-clipboard", daemon=True)
+
+    def start(self, timeout: float = 2.0) -> bool:
+        """Start listening; returns False if the listener could not be registered."""
+        self._thread.start()
+        self._ready.wait(timeout)
+        return self._started
+
+    def stop(self) -> None:
+        if self._hwnd:
+            user32.PostMessageW(self._hwnd, WM_CLOSE, 0, 0)
+            self._thread.join(timeout=1.0)
+        if self.event_handle:
+            kernel32.CloseHandle(self.event_handle)
+            self.event_handle = None
+
+    def drain(self) -> List[Optional[str]]:
+        """Return every queued clipboard change without blocking."""
+        pending: List[Optional[str]] = []
+        while True:
+            try:
+                pending.append(self.changes.get_nowait())
+            except queue.Empty:
+                return pending
+
+    def _handle_message(self, hwnd: int, msg: int, wparam: int, lparam: int) -> int:
+        if msg == WM_CLIPBOARDUPDATE:
+            # Some apps trigger repeat notifications for one write; only read when the counter moved.
+            seq = clipboard_sequence_number()
+            if seq == self._last_seq:
+                return 0
+            self._last_seq = seq
+            self.changes.put(self._reader())
+            kernel32.SetEvent(self.event_handle)
+            return 0
+        if msg == WM_CLOSE:
+            user32.RemoveClipboardFormatListener(hwnd)
+            user32.DestroyWindow(hwnd)
+            return 0
+        if msg == WM_DESTROY:
+            user32.PostQuitMessage(0)
+            return 0
+        return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+    def _run(self) -> None:
+        try:
+            hinstance = kernel32.GetModuleHandleW(None)
+            if not _ensure_window_class(hinstance):
+                return
+            hwnd = user32.CreateWindowExW(0, _CLASS_NAME, _CLASS_NAME, 0, 0, 0, 0, 0, HWND_MESSAGE, None, hinstance, None)
+            if not hwnd:
+                return
+            _listeners[hwnd] = self
+            if not user32.AddClipboardFormatListener(hwnd):
+                _listeners.pop(hwnd, None)
+                user32.DestroyWindow(hwnd)
+                return
+            self._hwnd = hwnd
+            self._started = True
+        finally:
+            self._ready.set()
+
+        msg = wintypes.MSG()
+        try:
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            _listeners.pop(hwnd, None)
+
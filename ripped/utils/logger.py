@@ -1,33 +1,71 @@
-from datetime import datetime
-from typing import Any, Callable, Optional
+import atexit
+import sys
+import time
+from typing import Any, Callable, Iterable, Optional
 
 LogSink = Callable[[str, Any], None]
 _custom_sink: Optional[LogSink] = None
 
+# Last formatted UTC timestamp; reformatted at most once per wall-clock second.
+_last_ts_sec = -1
+_last_ts_str = ""
+
 
 def _timestamp() -> str:
-    return datetime.utcnow().strftime("%H:%M:%S")
+    # Racing threads can only rewrite the same second's string, so no lock is needed.
+    global _last_ts_sec, _last_ts_str
+    now = int(time.time())
+    if now != _last_ts_sec:
+        _last_ts_str = time.strftime("%H:%M:%S", time.gmtime(now))
+        _last_ts_sec = now
+    return _last_ts_str
 
 
-def log_info(message: Any) -> None:
+# Log calls take (message, *args) as in stdlib logging; % is applied only when args are given.
+def log_info(message: Any, *args: Any) -> None:
+    if args:
+        message = message % args
     if _custom_sink:
         _custom_sink("INFO", message)
     else:
-        print(f"[{_timestamp()}] INFO: {message}")
+        sys.stdout.write(f"[{_timestamp()}] INFO: {message}\n")
+
+
+def log_info_lines(lines: Iterable[Any]) -> None:
+    """Log several INFO lines at once; on stdout they go out in a single write."""
+    if _custom_sink:
+        # Sinks keep their one-call-per-line contract; only the stdout path batches.
+        for line in lines:
+            _custom_sink("INFO", line)
+    else:
+        ts = _timestamp()
+        sys.stdout.write("".join(f"[{ts}] INFO: {line}\n" for line in lines))
 
 
-def log_error(message: Any) -> None:
+def log_error(message: Any, *args: Any) -> None:
+    if args:
+        message = message % args
     if _custom_sink:
         _custom_sink("ERROR", message)
     else:
         print(f"[{_timestamp()}] ERROR: {message}")
 
 
-def log_debug(message: Any) -> None:
+def log_debug(message: Any, *args: Any) -> None:
+    if args:
+        message = message % args
     if _custom_sink:
         _custom_sink("DEBUG", message)
     else:
-        print(f"[{_timestamp()}] DEBUG: {message}")
+        sys.stdout.write(f"[{_timestamp()}] DEBUG: {message}\n")
+
+
+def _flush_stdout() -> None:
+    sys.stdout.flush()
+
+
+# Info/debug lines are written without an explicit flush; make sure they land before exit.
+atexit.register(_flush_stdout)
 
 
 def set_log_sink(sink: LogSink | None) -> None:
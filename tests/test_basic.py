@@ -37,10 +37,10 @@ def test_parse_args_convert(tmp_path):
         ["video"],
         ["video", "max"],
         ["convert"],
-        ["convert", "missing-path"],
         ["invalid", "max", "http://example.com"],
         ["video", "bad", "http://example.com"],
         ["video", "720", "not-a-url"],
+        ["video", "720", "httpfoo://example.com"],
     ],
 )
 def test_parse_args_invalid(argv):
@@ -58,3 +58,60 @@ def test_build_format_string_video_with_height():
 
 def test_build_format_string_audio():
     assert build_format_string("audio", None) == "bestaudio/best"
+
+
+def test_parse_args_convert_with_jobs(tmp_path):
+    target = tmp_path / "sample.webm"
+    target.write_text("placeholder")
+    assert parse_args(["convert", str(target), "--jobs", "4"]).jobs == 4
+    assert parse_args(["convert", "--jobs=2", str(target)]).jobs == 2
+    assert parse_args(["convert", str(target)]).jobs is None
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["convert", ".", "--jobs"],
+        ["convert", ".", "--jobs", "0"],
+        ["convert", ".", "--jobs=abc"],
+        ["video", "720", "http://example.com", "--jobs", "2"],
+    ],
+)
+def test_parse_args_invalid_jobs(argv):
+    with pytest.raises(ValueError):
+        parse_args(argv)
+
+
+def test_download_with_ytdlp_reuses_instance(monkeypatch, tmp_path):
+    from ripped.core import downloader
+
+    created = []
+
+    class FakeYoutubeDL:
+        def __init__(self, opts):
+            self.opts = opts
+            self.closed = False
+            created.append(self)
+
+        def extract_info(self, url, download):
+            return {"title": url.rsplit("/", 1)[-1], "ext": "webm"}
+
+        def prepare_filename(self, info):
+            return str(tmp_path / f"{info['title']}.{info['ext']}")
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr(downloader, "yt_dlp", type("FakeModule", (), {"YoutubeDL": FakeYoutubeDL}))
+    downloader.close_downloaders()
+
+    first = downloader.download_with_ytdlp("https://example.com/a", "bestaudio/best")
+    second = downloader.download_with_ytdlp("https://example.com/b", "bestaudio/best")
+    downloader.download_with_ytdlp("https://example.com/c", "bestvideo+bestaudio/best")
+
+    assert first["filepath"] == tmp_path / "a.webm"
+    assert second["title"] == "b"
+    assert len(created) == 2
+
+    downloader.close_downloaders()
+    assert all(ydl.closed for ydl in created)
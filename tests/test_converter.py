@@ -0,0 +1,149 @@
+import subprocess
+
+from ripped.config.settings import DEFAULT_AUDIO_BITRATE
+from ripped.core import converter
+from ripped.core.converter import _plan_outputs, find_media_files, run_bulk_conversion
+from ripped.core.ffmpeg_tools import FFMPEG_QUIET_ARGS
+
+
+def test_find_media_files_recursive(tmp_path):
+    (tmp_path / "nested" / "deeper").mkdir(parents=True)
+    expected = {
+        tmp_path / "a.webm",
+        tmp_path / "nested" / "b.MKV",
+        tmp_path / "nested" / "deeper" / "c.mkv",
+    }
+    for path in expected:
+        path.write_text("placeholder")
+    (tmp_path / "notes.txt").write_text("placeholder")
+    (tmp_path / ".webm").write_text("placeholder")
+    (tmp_path / "nested" / "clip.mp4").write_text("placeholder")
+
+    found = find_media_files(tmp_path)
+
+    assert set(found) == {path.resolve() for path in expected}
+    assert all(path.is_absolute() for path in found)
+
+
+def test_find_media_files_single_file(tmp_path):
+    media = tmp_path / "clip.webm"
+    media.write_text("placeholder")
+    other = tmp_path / "clip.txt"
+    other.write_text("placeholder")
+
+    assert find_media_files(media) == [media.resolve()]
+    assert find_media_files(other) == []
+    assert find_media_files(tmp_path / "missing") == []
+
+
+def test_run_bulk_conversion_missing_path(tmp_path):
+    assert run_bulk_conversion(tmp_path / "missing") == 1
+
+
+def test_plan_outputs_avoids_collisions(tmp_path):
+    (tmp_path / "clip.mp4").write_text("existing")
+    sources = [tmp_path / "clip.webm", tmp_path / "clip.mkv", tmp_path / "other.mkv"]
+
+    outputs = [output for _, output in _plan_outputs(sources)]
+
+    assert outputs == [
+        tmp_path / "clip_converted.mp4",
+        tmp_path / "clip_converted_1.mp4",
+        tmp_path / "other.mp4",
+    ]
+
+
+def test_mp4_output_args_probes_only_mkv(monkeypatch, tmp_path):
+    probed = []
+
+    def fake_probe(path):
+        probed.append(path.name)
+        return "aac"
+
+    monkeypatch.setattr(converter, "probe_audio_codec", fake_probe)
+
+    webm_args = converter._mp4_output_args(tmp_path / "a.webm", tmp_path / "a.mp4")
+    mkv_args = converter._mp4_output_args(tmp_path / "b.mkv", tmp_path / "b.mp4")
+
+    assert probed == ["b.mkv"]
+    assert webm_args[:4] == ("-c:v", "copy", "-c:a", "aac")
+    assert mkv_args[:4] == ("-c:v", "copy", "-c:a", "copy")
+
+
+def _fake_ffmpeg(calls, failures=0):
+    def run(cmd):
+        calls.append(list(cmd))
+        if len(calls) <= failures:
+            return subprocess.CompletedProcess(cmd, 1, b"", b"boom")
+        for arg in cmd:
+            if arg.endswith(".mp4"):
+                converter.Path(arg).write_text("converted")
+        return subprocess.CompletedProcess(cmd, 0, b"", b"")
+
+    return run
+
+
+def test_convert_batch_maps_each_input_to_its_output(monkeypatch, tmp_path):
+    jobs = [(tmp_path / "a.webm", tmp_path / "a.mp4"), (tmp_path / "b.webm", tmp_path / "b.mp4")]
+    for source, _ in jobs:
+        source.write_text("source")
+    calls = []
+    monkeypatch.setattr(converter, "_run_ffmpeg", _fake_ffmpeg(calls))
+
+    results = converter._convert_batch_to_mp4(jobs, "ffmpeg")
+
+    assert results == [output for _, output in jobs]
+    encode = ["-c:v", "copy", "-c:a", "aac", "-b:a", DEFAULT_AUDIO_BITRATE]
+    assert calls == [
+        [
+            "ffmpeg",
+            *FFMPEG_QUIET_ARGS,
+            "-y",
+            "-i",
+            str(jobs[0][0]),
+            "-i",
+            str(jobs[1][0]),
+            *["-map", "0:v:0?", "-map", "0:a:0?", *encode, str(jobs[0][1])],
+            *["-map", "1:v:0?", "-map", "1:a:0?", *encode, str(jobs[1][1])],
+        ]
+    ]
+    assert not any(source.exists() for source, _ in jobs)
+
+
+def test_convert_batch_retries_one_at_a_time(monkeypatch, tmp_path):
+    jobs = [(tmp_path / "a.webm", tmp_path / "a.mp4"), (tmp_path / "b.webm", tmp_path / "b.mp4")]
+    for source, _ in jobs:
+        source.write_text("source")
+    calls = []
+    monkeypatch.setattr(converter, "_run_ffmpeg", _fake_ffmpeg(calls, failures=1))
+
+    results = converter._convert_batch_to_mp4(jobs, "ffmpeg")
+
+    assert results == [output for _, output in jobs]
+    assert len(calls) == 3
+    # Retries use the same stream selection as the batch.
+    encode = ["-c:v", "copy", "-c:a", "aac", "-b:a", DEFAULT_AUDIO_BITRATE]
+    assert calls[1:] == [
+        ["ffmpeg", *FFMPEG_QUIET_ARGS, "-y", "-i", str(source), "-map", "0:v:0?", "-map", "0:a:0?", *encode, str(output)]
+        for source, output in jobs
+    ]
+
+
+def test_run_bulk_conversion_reports_failures_to_log_sink(monkeypatch, tmp_path):
+    from ripped.utils import logger
+
+    for name in ("a.webm", "b.webm"):
+        (tmp_path / name).write_text("source")
+    monkeypatch.setattr(converter, "_require_ffmpeg", lambda: "ffmpeg")
+    monkeypatch.setattr(converter, "_run_ffmpeg", lambda cmd: subprocess.CompletedProcess(cmd, 1, b"", b"boom"))
+    received = []
+    logger.set_log_sink(lambda level, message: received.append((level, message)))
+    try:
+        assert run_bulk_conversion(tmp_path, jobs=2) == 2
+    finally:
+        logger.clear_log_sink()
+
+    errors = {message for level, message in received if level == "ERROR"}
+    assert errors == {f"Conversion failed for {tmp_path.resolve() / name}: boom" for name in ("a.webm", "b.webm")}
+    progress = sorted(message for _, message in received if message.startswith("["))
+    assert progress[0].startswith("[1/2] failed: ") and progress[1].startswith("[2/2] failed: ")
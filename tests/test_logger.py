@@ -0,0 +1,21 @@
+from ripped.utils import logger
+
+
+def test_log_sink_routing(capsys):
+    received = []
+    logger.set_log_sink(lambda level, message: received.append((level, message)))
+    try:
+        logger.log_info("hello")
+        logger.log_error("boom: %s", 42)
+        logger.log_info_lines(["one", "two"])
+    finally:
+        logger.clear_log_sink()
+    logger.log_info("back to %s", "stdout")
+    logger.log_info("100% literal")
+    logger.log_info_lines(["three", "four"])
+
+    assert received == [("INFO", "hello"), ("ERROR", "boom: 42"), ("INFO", "one"), ("INFO", "two")]
+    out = capsys.readouterr().out
+    assert "INFO: back to stdout" in out
+    assert "INFO: 100% literal" in out
+    assert "INFO: three\n" in out and "INFO: four\n" in out
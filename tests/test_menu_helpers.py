@@ -1,4 +1,34 @@
-from ripped.main import format_quality_label
+import os
+import queue
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ripped import main as ripped_main
+from ripped.main import format_quality_label, main, prompt_quality
+
+
+class FakeListener:
+    """Stand-in for _clipboard_win.ClipboardListener with pre-queued clipboard changes."""
+
+    event_handle = "clipboard-event"
+
+    def __init__(self, clips=()):
+        self.changes = queue.Queue()
+        for clip in clips:
+            self.changes.put(clip)
+        self.stopped = False
+
+    def drain(self):
+        pending = []
+        while not self.changes.empty():
+            pending.append(self.changes.get_nowait())
+        return pending
+
+    def stop(self):
+        self.stopped = True
 
 
 def test_format_quality_label_max():
@@ -7,3 +37,229 @@ def test_format_quality_label_max():
 
 def test_format_quality_label_number():
     assert format_quality_label(720) == "720"
+
+
+def test_main_help_skips_parsing(capsys):
+    assert main(["--help"]) == 0
+    assert "Usage:" in capsys.readouterr().out
+
+
+def test_main_version(capsys):
+    assert main(["--version"]) == 0
+    assert capsys.readouterr().out.startswith("ripped ")
+
+
+def test_format_quality_label_custom_height():
+    assert format_quality_label(128) == "128"
+
+
+def test_prompt_quality_lookup(monkeypatch):
+    sentinel = object()
+    monkeypatch.setattr("builtins.input", lambda _prompt: "4")
+    assert prompt_quality(sentinel) == 720
+    monkeypatch.setattr("builtins.input", lambda _prompt: "9")
+    assert prompt_quality(sentinel) is sentinel
+
+
+def test_run_bulk_downloads_pipeline(monkeypatch, tmp_path):
+    def fake_download(mode, quality, url):
+        if url.endswith("bad"):
+            return ripped_main.EXIT_DOWNLOAD_ERROR, None
+        return ripped_main.EXIT_OK, tmp_path / url.rsplit("/", 1)[-1]
+
+    converted = []
+
+    def fake_convert(mode, downloaded_path):
+        converted.append(downloaded_path.name)
+        return ripped_main.EXIT_FFMPEG_ERROR if downloaded_path.name == "c" else ripped_main.EXIT_OK
+
+    monkeypatch.setattr(ripped_main, "_download_stage", fake_download)
+    monkeypatch.setattr(ripped_main, "_convert_stage", fake_convert)
+
+    urls = ["https://example.com/a", "https://example.com/bad", "https://example.com/c"]
+    results = ripped_main.run_bulk_downloads("video", None, urls)
+
+    assert results == [ripped_main.EXIT_OK, ripped_main.EXIT_DOWNLOAD_ERROR, ripped_main.EXIT_FFMPEG_ERROR]
+    assert sorted(converted) == ["a", "c"]
+
+
+def test_run_bulk_downloads_reports_stage_exceptions(monkeypatch, capsys):
+    def fake_download(mode, quality, url):
+        raise FileExistsError("downloads")
+
+    closed = []
+    monkeypatch.setattr(ripped_main, "_download_stage", fake_download)
+    monkeypatch.setattr(ripped_main, "close_downloaders", lambda: closed.append(True))
+
+    results = ripped_main.run_bulk_downloads("video", None, ["https://example.com/a"])
+
+    assert results == [ripped_main.EXIT_DOWNLOAD_ERROR]
+    out = capsys.readouterr().out
+    assert "[1/1] https://example.com/a" in out
+    assert "Download failed for https://example.com/a: downloads" in out
+    assert closed == [True]
+
+
+def test_run_bulk_downloads_reports_convert_exceptions(monkeypatch, tmp_path, capsys):
+    def fake_convert(mode, downloaded_path):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ripped_main, "_download_stage", lambda mode, quality, url: (ripped_main.EXIT_OK, tmp_path / "a"))
+    monkeypatch.setattr(ripped_main, "_convert_stage", fake_convert)
+
+    results = ripped_main.run_bulk_downloads("video", None, ["https://example.com/a"])
+
+    assert results == [ripped_main.EXIT_FFMPEG_ERROR]
+    assert "Conversion failed for https://example.com/a: disk full" in capsys.readouterr().out
+
+
+def test_run_bulk_downloads_cancels_pending_on_interrupt(monkeypatch, capsys):
+    started = []
+    closed_after = []
+
+    def fake_download(mode, quality, url):
+        started.append(url)
+        time.sleep(0.05)
+        return ripped_main.EXIT_DOWNLOAD_ERROR, None
+
+    class InterruptingQueue(queue.Queue):
+        def get(self, *args, **kwargs):
+            # Simulate Ctrl+C while the main thread waits for the first finished download.
+            while not started:
+                time.sleep(0.001)
+            raise KeyboardInterrupt
+
+    monkeypatch.setenv("RIPPED_BULK_CONCURRENCY", "2")
+    monkeypatch.setattr(ripped_main, "_download_stage", fake_download)
+    monkeypatch.setattr(ripped_main, "close_downloaders", lambda: closed_after.append(len(started)))
+    monkeypatch.setattr(ripped_main, "queue", SimpleNamespace(Queue=InterruptingQueue, Empty=queue.Empty))
+
+    urls = [f"https://example.com/{idx}" for idx in range(12)]
+    with pytest.raises(KeyboardInterrupt):
+        ripped_main.run_bulk_downloads("video", None, urls)
+
+    assert len(started) <= 4
+    # Instances are closed only after the downloads that did start have returned.
+    assert closed_after == [len(started)]
+    assert not any(thread.name.startswith("ripped-download") for thread in threading.enumerate())
+    assert "Download failed" not in capsys.readouterr().out
+
+
+def test_precheck_urls_drops_dead_links(monkeypatch, capsys):
+    statuses = {"https://example.com/gone": 404, "https://example.com/head": 405, "https://example.com/down": None}
+    monkeypatch.setattr(ripped_main, "_head_status", lambda url: statuses.get(url, 200))
+
+    urls = ["https://example.com/a", "https://example.com/gone", "https://example.com/head", "https://example.com/down"]
+    assert ripped_main.precheck_urls(urls) == [
+        "https://example.com/a",
+        "https://example.com/head",
+        "https://example.com/down",
+    ]
+    assert "Checking 4 URLs..." in capsys.readouterr().out
+
+
+def test_head_status_inconclusive_for_malformed_urls():
+    # urllib raises http.client.InvalidURL for these before any network access.
+    assert ripped_main._head_status("https://example.com/a b") is None
+    assert ripped_main._head_status("http://example.com:abc/") is None
+
+
+def test_bulk_concurrency_env_override(monkeypatch):
+    monkeypatch.delenv("RIPPED_BULK_CONCURRENCY", raising=False)
+    assert ripped_main._bulk_concurrency() == ripped_main.DEFAULT_BULK_CONCURRENCY
+    monkeypatch.setenv("RIPPED_BULK_CONCURRENCY", "2")
+    assert ripped_main._bulk_concurrency() == 2
+    monkeypatch.setenv("RIPPED_BULK_CONCURRENCY", "nope")
+    assert ripped_main._bulk_concurrency() == ripped_main.DEFAULT_BULK_CONCURRENCY
+
+
+def test_windows_bulk_loop_handles_queued_copies(monkeypatch):
+    class FakeMsvcrt:
+        keys = list("q")
+
+        def kbhit(self):
+            return bool(self.keys)
+
+        def getwch(self):
+            return self.keys.pop(0)
+
+    listener = FakeListener(["https://example.com/a", "not a url", "https://example.com/b"])
+    monkeypatch.setattr(ripped_main, "msvcrt", FakeMsvcrt())
+    monkeypatch.setattr(ripped_main, "_start_clipboard_listener", lambda: listener)
+
+    urls = ripped_main._prompt_bulk_urls_windows(baseline_clip=None)
+
+    assert urls == ["https://example.com/a", "https://example.com/b"]
+    assert listener.stopped
+
+
+def test_windows_bulk_loop_waits_on_console_and_clipboard(monkeypatch):
+    listener = FakeListener()
+    keys = []
+    discarded = []
+    sleeps = []
+    # Each wait delivers one event: a failed wait, a copy, a non-key console event, then the 'q' keystroke.
+    wakeups = iter(
+        [
+            (None, lambda: None),
+            (1, lambda: listener.changes.put("https://example.com/a")),
+            (0, lambda: None),
+            (0, lambda: keys.append("q")),
+        ]
+    )
+
+    def wait_for_handles(handles, timeout):
+        assert handles == ("console", "clipboard-event")
+        index, deliver = next(wakeups)
+        deliver()
+        return index
+
+    fake_win = SimpleNamespace(
+        console_input_handle=lambda: "console",
+        wait_for_handles=wait_for_handles,
+        discard_non_key_input=discarded.append,
+    )
+    fake_msvcrt = SimpleNamespace(kbhit=lambda: bool(keys), getwch=lambda: keys.pop(0))
+    monkeypatch.setattr(ripped_main, "_clipboard_win", fake_win)
+    monkeypatch.setattr(ripped_main, "msvcrt", fake_msvcrt)
+    monkeypatch.setattr(ripped_main, "_start_clipboard_listener", lambda: listener)
+    monkeypatch.setattr(ripped_main.time, "sleep", sleeps.append)
+
+    urls = ripped_main._prompt_bulk_urls_windows(baseline_clip=None)
+
+    assert urls == ["https://example.com/a"]
+    # Only the failed wait falls back to sleeping.
+    assert sleeps == [ripped_main.CLIPBOARD_POLL_MIN_INTERVAL]
+    assert discarded == ["console"]
+    assert listener.stopped
+
+
+def test_poll_interval_backs_off_while_idle():
+    assert ripped_main._poll_interval(0) == ripped_main.CLIPBOARD_POLL_MIN_INTERVAL
+    assert ripped_main._poll_interval(1.5) == ripped_main.CLIPBOARD_POLL_MIN_INTERVAL * 2
+    assert ripped_main._poll_interval(60) == ripped_main.CLIPBOARD_POLL_MAX_INTERVAL
+
+
+def test_posix_bulk_loop_reads_lines_and_clipboard(monkeypatch):
+    monkeypatch.setattr(ripped_main, "read_clipboard", lambda: "https://example.com/copied")
+    monkeypatch.setattr(ripped_main, "POSIX_CLIPBOARD_POLL_INTERVAL", 0.01)
+
+    read_fd, write_fd = os.pipe()
+    try:
+        os.write(write_fd, b"https://example.com/typed\nnot-a-url\n")
+        # Quit only after a few selector timeouts so the clipboard gets polled.
+        timer = threading.Timer(0.1, os.write, args=(write_fd, b"q\n"))
+        timer.start()
+        urls = ripped_main._prompt_bulk_urls_posix(baseline_clip=None, fd=read_fd)
+        timer.join()
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+    assert urls == ["https://example.com/typed", "https://example.com/copied"]
+
+
+def test_menu_row_center_matches_str_center():
+    theme = ripped_main._MenuTheme()
+    theme.__dict__["width"] = 9  # inner width 5
+    assert theme.row_center("ab") == f"{theme.edge}   ab  {theme.edge}"